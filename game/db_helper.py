@@ -5,12 +5,14 @@
 """
 
 import sqlite3
-import json
 from pathlib import Path
 from datetime import datetime
 
 DB_PATH = Path(__file__).parent / "xiuxian.db"
 
+# 可堆叠的物品类型
+STACKABLE_TYPES = frozenset(('灵石', '丹药', '符箓', '材料'))
+
 
 def get_connection():
     """获取数据库连接"""
@@ -188,7 +190,7 @@ def add_item(name: str, item_type: str, grade: str = None,
     """, (name, item_type))
     existing = cur.fetchone()
 
-    if existing and item_type in ['灵石', '丹药', '符箓', '材料']:
+    if existing and item_type in STACKABLE_TYPES:
         # 可堆叠物品，增加数量
         cur.execute("""
             UPDATE inventory SET quantity = quantity + ?